@@ -16,8 +16,96 @@ from andes.core.common import dummify
 from andes.utils.func import interp_n2
 from andes.utils.tab import Tab
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 logger = logging.getLogger(__name__)
 
+# minimum input size for dispatching to the numba kernels;
+# below this, the fixed call overhead outweighs the fused loop
+NUMBA_MIN_SIZE = 64
+
+
+if njit is not None:
+
+    # NOTE: keep these kernels single-threaded. `parallel=True` loads numba's
+    # TBB threading layer, which deadlocks interpreter teardown in any process
+    # that compiled a kernel and then forked (e.g., multi-case `andes run`).
+    # The win here is the fused single pass, not threading.
+    @njit(cache=True)
+    def _limiter_kernel(u, lower, upper, zu, zl, zi, equal):  # pragma: no cover
+        """
+        Fused single-pass kernel for `Limiter.check_var`.
+        """
+        for i in range(u.shape[0]):
+            if equal:
+                above = u[i] >= upper[i]
+                below = u[i] <= lower[i]
+            else:
+                above = u[i] > upper[i]
+                below = u[i] < lower[i]
+            zu[i] = 1 if above else 0
+            zl[i] = 1 if below else 0
+            zi[i] = 0 if (above or below) else 1
+
+    @njit(cache=True)
+    def _deadband_rt_kernel(u, lower, upper, zu, zl, zi, zur, zlr, equal):  # pragma: no cover
+        """
+        Fused kernel for `DeadBandRT.check_var`.
+
+        ``zu``, ``zl``, and ``zi`` hold the previous-step flags on entry
+        and are overwritten with the current flags.
+        """
+        for i in range(u.shape[0]):
+            if equal:
+                above = u[i] >= upper[i]
+                below = u[i] <= lower[i]
+            else:
+                above = u[i] > upper[i]
+                below = u[i] < lower[i]
+            inside = not (above or below)
+
+            hold = (zi[i] == 1) == inside
+            zur[i] = 1 if ((zu[i] == 1 and inside) or (zur[i] == 1 and hold)) else 0
+            zlr[i] = 1 if ((zl[i] == 1 and inside) or (zlr[i] == 1 and hold)) else 0
+
+            zu[i] = 1 if above else 0
+            zl[i] = 1 if below else 0
+            zi[i] = 1 if inside else 0
+
+    @njit(fastmath=True, cache=True)
+    def _avg_kernel(v_mem, t, out):  # pragma: no cover
+        """
+        Single-pass trapezoidal average for `Average.check_var`.
+
+        ``v_mem`` and ``t`` must be in chronological order.
+        """
+        denom = t[t.shape[0] - 1] - t[0]
+        for i in range(v_mem.shape[0]):
+            acc = 0.0
+            for j in range(1, t.shape[0]):
+                acc += 0.5 * (v_mem[i, j] + v_mem[i, j - 1]) * (t[j] - t[j - 1])
+            out[i] = acc / denom
+
+    @njit(cache=True, fastmath=True)
+    def _interp2(t_interp, t0, t1, v0, v1, out):  # pragma: no cover
+        """
+        Two-point linear interpolation written into ``out``.
+
+        ``out`` may alias ``v0``; each element is read before written.
+        """
+        alpha = (t_interp - t0) / (t1 - t0)
+        for i in range(out.shape[0]):
+            out[i] = v0[i] + alpha * (v1[i] - v0[i])
+
+else:
+    _limiter_kernel = None
+    _deadband_rt_kernel = None
+    _avg_kernel = None
+    _interp2 = None
+
 
 class Discrete:
     """
@@ -26,6 +114,12 @@ class Discrete:
     Discrete classes export flag arrays (usually boolean) .
     """
 
+    # dtype of the exported flag arrays allocated in `list2array`.
+    # Subclasses whose flags are pure 0/1 indicators override this with
+    # ``np.int8`` to reduce memory traffic; classes exporting real values
+    # (e.g., `Delay`) keep the float default.
+    flag_dtype = np.float64
+
     def __init__(self, name=None, tex_name=None, info=None, no_warn=False,
                  min_iter=2, err_tol=1e-2,
                  ):
@@ -131,7 +225,8 @@ class Discrete:
         """
 
         for flag in self.export_flags:
-            self.__dict__[flag] = self.__dict__[flag] * np.ones(n, dtype=float)
+            val = np.asarray(self.__dict__[flag], dtype=self.flag_dtype)
+            self.__dict__[flag] = np.broadcast_to(val, (n,)).copy()
 
     def warn_init_limit(self):
         """
@@ -251,6 +346,8 @@ class LessThan(Discrete):
     By default, the model will not adjust the limit.
     """
 
+    flag_dtype = np.int8
+
     def __init__(self, u, bound, equal=False, enable=True, name=None, tex_name=None,
                  info: str = None, cache: bool = False,
                  z0=0, z1=1):
@@ -279,6 +376,7 @@ class LessThan(Discrete):
         """
 
         if not self.enable:
+            self.__class__ = _CachedLessThan
             return
 
         if self.cache and self._eval:
@@ -289,10 +387,28 @@ class LessThan(Discrete):
         else:
             self.z1[:] = np.less_equal(self.u.v, self.bound.v)
 
-        self.z0[:] = np.logical_not(self.z1)
+        # `z0` is the negation of `z1`; a subtraction into the
+        # preallocated buffer avoids the `logical_not` pass and cast
+        np.subtract(1, self.z1, out=self.z0)
 
         self._eval = True
 
+        # flags are now frozen; specialize to skip the guards entirely
+        if self.cache:
+            self.__class__ = _CachedLessThan
+
+
+class _CachedLessThan(LessThan):
+    """
+    A `LessThan` whose flags are frozen; `check_var` is a no-op.
+
+    Instances specialize themselves into this class once caching fires or
+    when disabled, so steady-state calls skip the guard branches.
+    """
+
+    def check_var(self, *args, **kwargs):
+        return
+
 
 class IsEqual(Discrete):
     """
@@ -307,6 +423,8 @@ class IsEqual(Discrete):
     By default, the model will not adjust the limit.
     """
 
+    flag_dtype = np.int8
+
     def __init__(self, u, bound, enable=True, name=None, tex_name=None,
                  info: str = None, cache: bool = False, z1=1):
         super().__init__(name=name, tex_name=tex_name, info=info)
@@ -390,6 +508,8 @@ class Limiter(Discrete):
         Flags for violating the upper limit
     """
 
+    flag_dtype = np.int8
+
     def __init__(self, u, lower, upper, enable=True,
                  name: str = None, tex_name: str = None, info: str = None,
                  min_iter: int = 2, err_tol: float = 0.01,
@@ -455,29 +575,48 @@ class Limiter(Discrete):
         if not self.enable:
             return
 
+        # fused single-pass kernel for the common two-sided case;
+        # limit adjustments at init still take the NumPy path below
+        if (_limiter_kernel is not None) and (not is_init) and \
+                (not self.no_upper) and (not self.no_lower):
+            u = self.u.v
+            upper_v = -self.upper.v if self.sign_upper.v == -1 else self.upper.v
+            lower_v = -self.lower.v if self.sign_lower.v == -1 else self.lower.v
+
+            if isinstance(u, np.ndarray) and (u.size >= NUMBA_MIN_SIZE) and \
+                    isinstance(upper_v, np.ndarray) and (upper_v.size == u.size) and \
+                    isinstance(lower_v, np.ndarray) and (lower_v.size == u.size):
+                _limiter_kernel(u, lower_v, upper_v,
+                                self.zu, self.zl, self.zi, self.equal)
+                return
+
+        # hoist the attribute chain; `.v` may be rebound between calls,
+        # so the reference is not cached across steps
+        u = self.u.v
+
         if not self.no_upper:
             upper_v = -self.upper.v if self.sign_upper.v == -1 else self.upper.v
 
             # FIXME: adjust will not be successful when sign is -1
             if self.allow_adjust and is_init:
-                self.do_adjust_upper(self.u.v, upper_v, allow_adjust, adjust_upper)
+                self.do_adjust_upper(u, upper_v, allow_adjust, adjust_upper)
 
             if self.equal:
-                self.zu[:] = np.greater_equal(self.u.v, upper_v)
+                self.zu[:] = np.greater_equal(u, upper_v)
             else:
-                self.zu[:] = np.greater(self.u.v, upper_v)
+                self.zu[:] = np.greater(u, upper_v)
 
         if not self.no_lower:
             lower_v = -self.lower.v if self.sign_lower.v == -1 else self.lower.v
 
             # FIXME: adjust will not be successful when sign is -1
             if self.allow_adjust and is_init:
-                self.do_adjust_lower(self.u.v, lower_v, allow_adjust, adjust_lower)
+                self.do_adjust_lower(u, lower_v, allow_adjust, adjust_lower)
 
             if self.equal:
-                self.zl[:] = np.less_equal(self.u.v, lower_v)
+                self.zl[:] = np.less_equal(u, lower_v)
             else:
-                self.zl[:] = np.less(self.u.v, lower_v)
+                self.zl[:] = np.less(u, lower_v)
 
         self.zi[:] = np.logical_not(np.logical_or(self.zu, self.zl))
 
@@ -550,6 +689,97 @@ class Limiter(Discrete):
                 self._show_adjust(val, upper, mask, self.lower.name, adjusted=False)
 
 
+class LimiterGroup:
+    """
+    Structure-of-arrays batch for homogeneous `Limiter` instances.
+
+    Many models carry several small two-sided limiters whose `check_var`
+    calls each dispatch a handful of ufuncs over tiny arrays. This class
+    concatenates the flag storage of registered limiters into contiguous
+    buffers so that one batched `check_var` call updates all of them
+    with three ufunc passes in total.
+
+    Only plain two-sided limiters with default signs are accepted.
+    Registered limiters must have been through `list2array`; their `zu`,
+    `zl`, and `zi` attributes are rebound to views into the shared
+    buffers by `finalize`.
+    """
+
+    def __init__(self, equal=True):
+        self.equal = equal
+        self.limiters = []
+        self._u = None
+        self._lower = None
+        self._upper = None
+        self._zu = None
+        self._zl = None
+        self._zi = None
+        self._boundaries = []
+
+    def add(self, limiter):
+        """
+        Register a limiter for batching.
+        """
+
+        if limiter.no_lower or limiter.no_upper:
+            raise ValueError("LimiterGroup only accepts two-sided limiters")
+        if (limiter.sign_lower.v == -1) or (limiter.sign_upper.v == -1):
+            raise ValueError("LimiterGroup only accepts default-sign limiters")
+        if limiter.equal != self.equal:
+            raise ValueError("LimiterGroup requires a uniform `equal` setting")
+
+        self.limiters.append(limiter)
+
+    def finalize(self):
+        """
+        Allocate the shared buffers and rebind limiter flags to views.
+        """
+
+        sizes = [lim.zi.size for lim in self.limiters]
+        total = int(np.sum(sizes, dtype=int))
+
+        self._u = np.zeros(total)
+        self._lower = np.zeros(total)
+        self._upper = np.zeros(total)
+        self._zu = np.zeros(total)
+        self._zl = np.zeros(total)
+        self._zi = np.ones(total)
+
+        self._boundaries = []
+        start = 0
+        for lim, size in zip(self.limiters, sizes):
+            stop = start + size
+            self._boundaries.append((start, stop))
+            self._zu[start:stop] = lim.zu
+            self._zl[start:stop] = lim.zl
+            self._zi[start:stop] = lim.zi
+            lim.zu = self._zu[start:stop]
+            lim.zl = self._zl[start:stop]
+            lim.zi = self._zi[start:stop]
+            start = stop
+
+    def check_var(self):
+        """
+        Update all registered limiters with three batched ufunc calls.
+        """
+
+        for lim, (start, stop) in zip(self.limiters, self._boundaries):
+            self._u[start:stop] = lim.u.v
+            self._lower[start:stop] = lim.lower.v
+            self._upper[start:stop] = lim.upper.v
+
+        if self.equal:
+            np.greater_equal(self._u, self._upper, out=self._zu, casting='unsafe')
+            np.less_equal(self._u, self._lower, out=self._zl, casting='unsafe')
+        else:
+            np.greater(self._u, self._upper, out=self._zu, casting='unsafe')
+            np.less(self._u, self._lower, out=self._zl, casting='unsafe')
+
+        # zi = 1 - (zu or zl), computed without bool temporaries
+        np.maximum(self._zu, self._zl, out=self._zi)
+        np.subtract(1, self._zi, out=self._zi)
+
+
 class SortedLimiter(Limiter):
     """
     A limiter that sorts inputs based on the absolute or
@@ -653,16 +883,18 @@ class SortedLimiter(Limiter):
         if self.auto:
             self.calc_select()
 
-        # sort in both ascending and descending orders
-        asc = np.argsort(lower_vio)
-        desc = np.argsort(upper_vio)
-        top_n = asc[:self.n_select]
-        bottom_n = desc[:self.n_select]
+        # `reset_out` flags the `n_select` worst violators on each side.
+        # `argpartition` finds them in O(N) without a full sort.
+        nval = len(lower_vio)
+        if self.n_select < nval:
+            top_n = np.argpartition(lower_vio, self.n_select)[:self.n_select]
+            bottom_n = np.argpartition(upper_vio, self.n_select)[:self.n_select]
 
-        # `reset_out` is used to flag the
-        reset_out = np.zeros_like(self.u.v)
-        reset_out[top_n] = 1
-        reset_out[bottom_n] = 1
+            reset_out = np.zeros_like(self.u.v)
+            reset_out[top_n] = 1
+            reset_out[bottom_n] = 1
+        else:
+            reset_out = np.ones_like(self.u.v)
 
         # set new flags
         self.zl[:] = np.logical_or(np.logical_and(reset_out, self.zl),
@@ -765,23 +997,22 @@ class AntiWindup(Limiter):
         """
         Check the variables and equations and set the limiter flags.
         Reset differential equation values based on limiter flags.
-
-        Notes
-        -----
-        The current implementation reallocates memory for `self.x_set` in each call.
-        Consider improving for speed. (TODO)
         """
+        # hoist the attribute chains for the hot comparisons
+        u = self.u.v
+        state_e = self.state.e
+
         if not self.no_upper:
             upper_v = -self.upper.v if self.sign_upper.v == -1 else self.upper.v
 
             if self.allow_adjust and is_init:
-                self.do_adjust_upper(self.u.v, upper_v,
+                self.do_adjust_upper(u, upper_v,
                                      allow_adjust=allow_adjust,
                                      adjust_upper=adjust_upper)
 
             self.zu0[:] = self.zu
-            self.zu[:] = np.logical_and(np.greater_equal(self.u.v, upper_v),
-                                        np.greater_equal(self.state.e, 0))
+            self.zu[:] = np.logical_and(np.greater_equal(u, upper_v),
+                                        np.greater_equal(state_e, 0))
 
             if niter > self.niter_lock:
                 self.zu[:] = np.logical_or(self.zu0, self.zu)
@@ -790,13 +1021,13 @@ class AntiWindup(Limiter):
             lower_v = -self.lower.v if self.sign_lower.v == -1 else self.lower.v
 
             if self.allow_adjust and is_init:
-                self.do_adjust_lower(self.u.v, lower_v,
+                self.do_adjust_lower(u, lower_v,
                                      allow_adjust=allow_adjust,
                                      adjust_lower=adjust_lower)
 
             self.zl0[:] = self.zl
-            self.zl[:] = np.logical_and(np.less_equal(self.u.v, lower_v),
-                                        np.less_equal(self.state.e, 0))
+            self.zl[:] = np.logical_and(np.less_equal(u, lower_v),
+                                        np.less_equal(state_e, 0))
             if niter > self.niter_lock:
                 self.zl[:] = np.logical_or(self.zl0, self.zl)
 
@@ -805,17 +1036,17 @@ class AntiWindup(Limiter):
         # must flush the `x_set` list at the beginning
         self.x_set = list()
 
-        if not np.all(self.zi):
-            idx = np.where(self.zi == 0)
-            self.state.e[:] = self.state.e * self.zi
-            self.state.v[:] = self.state.v * self.zi
+        if not self.zi.all():
+            mask = np.equal(self.zi, 0)  # boolean mask; no index-array allocation
+            np.multiply(self.state.e, self.zi, out=self.state.e)
+            np.multiply(self.state.v, self.zi, out=self.state.v)
             if not self.no_upper:
-                self.state.v[:] += upper_v * self.zu
+                np.add(self.state.v, upper_v * self.zu, out=self.state.v)
             if not self.no_lower:
-                self.state.v[:] += lower_v * self.zl
-            self.x_set.append((self.state.a[idx], self.state.v[idx], 0))  # (address, var. values, eqn. values)
+                np.add(self.state.v, lower_v * self.zl, out=self.state.v)
+            self.x_set.append((self.state.a[mask], self.state.v[mask], 0))  # (address, var. values, eqn. values)
 
-            # logger.debug(f'AntiWindup for states {self.state.a[idx]}')
+            # logger.debug(f'AntiWindup for states {self.state.a[mask]}')
 
         # Very important note:
         # The set equation values and variable values are collected by `System.fg_to_dae`:
@@ -840,6 +1071,8 @@ class RateLimiter(Discrete):
     Use `AntiWindupRate` for a rate-limited anti-windup limiter.
     """
 
+    flag_dtype = np.int8
+
     def __init__(self, u, lower, upper, enable=True,
                  no_lower=False, no_upper=False, lower_cond=1, upper_cond=1,
                  name=None, tex_name=None, info=None):
@@ -889,22 +1122,24 @@ class RateLimiter(Discrete):
         if not self.enable:
             return
 
+        u_e = self.u.e
+
         if not self.rate_no_lower:
-            self.zlr[:] = np.less(self.u.e, self.rate_lower.v)  # 1 if at the lower rate limit
+            self.zlr[:] = np.less(u_e, self.rate_lower.v)  # 1 if at the lower rate limit
 
             if self.rate_lower_cond is not None:
                 self.zlr[:] = self.zlr * self.rate_lower_cond.v  # 1 if both at the lower rate limit and enabled
 
             # for where `zlr == 1`, set the equation value to the lower limit
-            self.u.e[np.where(self.zlr)] = self.rate_lower.v[np.where(self.zlr)]
+            u_e[np.where(self.zlr)] = self.rate_lower.v[np.where(self.zlr)]
 
         if not self.rate_no_upper:
-            self.zur[:] = np.greater(self.u.e, self.rate_upper.v)
+            self.zur[:] = np.greater(u_e, self.rate_upper.v)
 
             if self.rate_upper_cond is not None:
                 self.zur[:] = self.zur * self.rate_upper_cond.v
 
-            self.u.e[np.where(self.zur)] = self.rate_upper.v[np.where(self.zur)]
+            u_e[np.where(self.zur)] = self.rate_upper.v[np.where(self.zur)]
 
 
 class AntiWindupRate(AntiWindup, RateLimiter):
@@ -983,6 +1218,8 @@ class Selector(Discrete):
 
     """
 
+    flag_dtype = np.int8
+
     def __init__(self, *args, fun, tex_name=None, info=None):
         super().__init__(tex_name=tex_name, info=info)
         # TODO: only allow two inputs
@@ -991,6 +1228,7 @@ class Selector(Discrete):
         self.n = len(args)
         self._inputs = None
         self._outputs = None
+        self._stack = None  # (n_inputs, n) buffer holding stacked input values
 
         # TODO: allow custom initial value
         for i in range(len(self.input_vars)):
@@ -1003,6 +1241,19 @@ class Selector(Discrete):
 
         self.has_check_var = True
 
+    def list2array(self, n):
+        """
+        Allocate the stacked flag matrix.
+
+        The per-input flags `s0`, `s1`, ... are views into rows of a
+        single contiguous matrix.
+        """
+
+        self._S = np.zeros((self.n, n), dtype=self.flag_dtype)
+        for i in range(self.n):
+            self.__dict__[f's{i}'] = self._S[i]
+        self._col = np.arange(n)
+
     def check_var(self, *args, **kwargs):
         """
         Set the i-th variable's flags to 1 if the return of the reduce function equals the i-th input.
@@ -1010,14 +1261,21 @@ class Selector(Discrete):
         if self._inputs is None:
             # input is only evaluated at the first time due to memory stability
             self._inputs = [self.input_vars[i].v for i in range(self.n)]
+            self._stack = np.empty((self.n, len(self._inputs[0])))
+
+        # refresh the contiguous stack so the reducer makes one linear pass
+        np.stack(self._inputs, out=self._stack)
 
         if self._outputs is None:
-            self._outputs = self.fun(self._inputs)
+            self._outputs = self.fun(self._stack)
         else:
-            self._outputs[:] = self.fun(self._inputs)
+            self._outputs[:] = self.fun(self._stack)
 
-        for i in range(self.n):
-            self.__dict__[f's{i}'][:] = np.equal(self._inputs[i], self._outputs)
+        # one argmax pass picks the winning input per element; ties resolve
+        # deterministically to the first input instead of setting two flags
+        winner = np.equal(self._stack, self._outputs).argmax(axis=0)
+        self._S.fill(0)
+        self._S[winner, self._col] = 1
 
 
 class Switcher(Discrete):
@@ -1063,11 +1321,21 @@ class Switcher(Discrete):
     where `IC_s0` is used for padding so that following flags align with the options.
     """
 
+    flag_dtype = np.int8
+
     def __init__(self, u, options: Union[list, Tuple], info: str = None,
                  name: str = None, tex_name: str = None, cache=True,):
         super().__init__(name=name, tex_name=tex_name, info=info,)
         self.u = u
         self.options: Union[List, Tuple] = options
+        self._opts = np.asarray(options)  # options as an array for vectorized comparison
+
+        # sorted options for `searchsorted`; `self._opt_index[j]` maps a
+        # sorted position back to the original option (flag) index
+        self._opt_index = np.argsort(self._opts)
+        self._opts_sorted = self._opts[self._opt_index]
+        self._S = None  # stacked (n_options, n) flag matrix set in `list2array`
+
         self.cache: bool = cache
         self._eval: bool = False  # if the flags has been evaluated
 
@@ -1087,24 +1355,67 @@ class Switcher(Discrete):
         if self.cache and self._eval:
             return
 
-        for v in self.u.v:
-            if v not in self.options and not np.isnan(v):
+        if len(self.u.v) > 0:
+            u = np.asarray(self.u.v)
+
+            # NaN marks "no option selected" and only exists in float inputs;
+            # string options (e.g., `Alter.method`) must skip `isnan`
+            if u.dtype.kind == 'f':
+                nan_mask = np.isnan(u)
+            else:
+                nan_mask = np.zeros(len(u), dtype=bool)
+
+            # one O(N log M) lookup instead of M equality passes
+            pos = np.searchsorted(self._opts_sorted, u)
+            pos = np.clip(pos, 0, len(self._opts_sorted) - 1)
+
+            invalid = np.logical_and(np.not_equal(self._opts_sorted[pos], u),
+                                     np.logical_not(nan_mask))
+            if invalid.any():
+                v = u[invalid][0]
                 raise ValueError(f'option {v} is invalid for {self.owner.class_name}.{self.u.name}. '
                                  f'Options are {self.options}.')
-        if len(self.u.v) > 0:
-            for i in range(len(self.options)):
-                self.__dict__[f's{i}'][:] = np.equal(self.u.v, self.options[i])
+
+            # scatter a one-hot column per element into the stacked flags
+            self._S.fill(0)
+            valid = np.nonzero(np.logical_not(nan_mask))[0]
+            self._S[self._opt_index[pos[valid]], valid] = 1
 
         self._eval = True
 
+        if self.cache:
+            self.__class__ = _CachedSwitcher
+
     def list2array(self, n):
         """
-        This forces to evaluate Switcher upon System setup
+        Allocate the stacked flag matrix and evaluate the flags.
+
+        The per-option flags `s0`, `s1`, ... are views into rows of a
+        single contiguous matrix. This also forces to evaluate Switcher
+        upon System setup.
         """
-        super().list2array(n)
+
+        self._S = np.zeros((len(self.options), n), dtype=self.flag_dtype)
+        for i in range(len(self.options)):
+            self.__dict__[f's{i}'] = self._S[i]
+
+        # re-arm a previously cached instance so the freshly zeroed flags
+        # are recomputed on re-setup (`check_var` restores the caching)
+        self.__class__ = Switcher
+        self._eval = False
+
         self.check_var()
 
 
+class _CachedSwitcher(Switcher):
+    """
+    A `Switcher` whose flags are frozen; `check_var` is a no-op.
+    """
+
+    def check_var(self, *args, **kwargs):
+        return
+
+
 class DeadBand(Limiter):
     r"""
     The basic deadband type.
@@ -1245,6 +1556,21 @@ class DeadBandRT(DeadBand):
 
         self.has_check_var = True
 
+        # previous-step flag buffers for the NumPy path
+        self._zu_prev = np.array([0.])
+        self._zi_prev = np.array([0.])
+        self._zl_prev = np.array([0.])
+
+    def list2array(self, n):
+        """
+        Allocate memory for flags and the previous-step buffers.
+        """
+
+        super().list2array(n)
+        self._zu_prev = np.zeros(n, dtype=self.flag_dtype)
+        self._zi_prev = np.zeros(n, dtype=self.flag_dtype)
+        self._zl_prev = np.zeros(n, dtype=self.flag_dtype)
+
     def check_var(self, *args, **kwargs):
         """
         Notes
@@ -1271,14 +1597,31 @@ class DeadBandRT(DeadBand):
          - hold when (previous zi == zi)
          - clear otherwise
         """
-        DeadBand.check_var(self, *args, **kwargs)
-
         if not self.enable:
             return
 
+        if (_deadband_rt_kernel is not None) and \
+                isinstance(self.u.v, np.ndarray) and (self.u.v.size >= NUMBA_MIN_SIZE) and \
+                isinstance(self.upper.v, np.ndarray) and (self.upper.v.size == self.u.v.size) and \
+                isinstance(self.lower.v, np.ndarray) and (self.lower.v.size == self.u.v.size):
+            _deadband_rt_kernel(self.u.v, self.lower.v, self.upper.v,
+                                self.zu, self.zl, self.zi,
+                                self.zur, self.zlr, self.equal)
+            return
+
+        # snapshot previous-step flags before `DeadBand.check_var` updates them
+        self._zu_prev[:] = self.zu
+        self._zi_prev[:] = self.zi
+        self._zl_prev[:] = self.zl
+
+        DeadBand.check_var(self, *args, **kwargs)
+
         # square return dead band
-        self.zur[:] = np.equal(self.zu + self.zi, 2) + self.zur * np.equal(self.zi, self.zi)
-        self.zlr[:] = np.equal(self.zl + self.zi, 2) + self.zlr * np.equal(self.zi, self.zi)
+        # all operands are 0/1 int8, so the update reduces to a bitwise
+        # circuit: set on return from a limit, hold while zi is unchanged
+        hold = np.equal(self._zi_prev, self.zi).view(np.int8)
+        np.bitwise_or(self._zu_prev & self.zi, self.zur & hold, out=self.zur)
+        np.bitwise_or(self._zl_prev & self.zi, self.zlr & hold, out=self.zlr)
 
 
 class Delay(Discrete):
@@ -1329,54 +1672,115 @@ class Delay(Discrete):
 
         super().list2array(n)
         if self.mode == 'step':
+            # step mode: fixed-size circular buffer; `self._widx` is the
+            # column holding the newest sample
             self._v_mem = np.zeros((n, self.delay + 1))
             self.t = np.zeros(self.delay + 1)
+            self._widx = 0
         else:
-            self._v_mem = np.zeros((n, 1))
+            # time mode: the history lives in a preallocated buffer, and
+            # `self.t` / `self._v_mem` are views of the active window
+            self._cap = 64
+            self._t_buf = np.zeros(self._cap)
+            self._m_buf = np.zeros((n, self._cap))
+            self._start = 0
+            self._stop = 1
+            self._bind_window()
+
+    def _bind_window(self):
+        """
+        Rebind `self.t` and `self._v_mem` to the active window views.
+        """
+
+        self.t = self._t_buf[self._start:self._stop]
+        self._v_mem = self._m_buf[:, self._start:self._stop]
+
+    def _push_time(self, dae_t):
+        """
+        Append a sample to the time-mode window with amortized O(1) cost.
+
+        The buffer is compacted in place when the window reaches the end
+        of the storage, or grown by doubling if the window occupies most
+        of it.
+        """
+
+        if self._stop == self._cap:
+            length = self._stop - self._start
+
+            if length >= self._cap // 2:
+                self._cap *= 2
+                t_buf = np.zeros(self._cap)
+                m_buf = np.zeros((self._m_buf.shape[0], self._cap))
+                t_buf[:length] = self._t_buf[self._start:self._stop]
+                m_buf[:, :length] = self._m_buf[:, self._start:self._stop]
+                self._t_buf = t_buf
+                self._m_buf = m_buf
+            else:
+                self._t_buf[:length] = self._t_buf[self._start:self._stop].copy()
+                self._m_buf[:, :length] = self._m_buf[:, self._start:self._stop].copy()
+
+            self._start, self._stop = 0, length
+
+        self._t_buf[self._stop] = dae_t
+        self._m_buf[:, self._stop] = self.u.v
+        self._stop += 1
+        self._bind_window()
 
     def check_var(self, dae_t, *args, **kwargs):
 
         # Storage:
-        # Output values is in the first col.
-        # Latest values are stored in /appended to the last column
+        # In step mode, the newest sample lives in column `self._widx` and
+        # the output in the column after it (circular).
+        # In time mode, the newest sample is appended to the last column
+        # and the output is in the first.
         self.rewind = False
 
+        newest = self._widx if self.mode == 'step' else -1
+
         if dae_t == 0:
             self._v_mem[:] = self.u.v[:, None]
 
-        elif dae_t < self.t[-1]:
+        elif dae_t < self.t[newest]:
             self.rewind = True
-            self.t[-1] = dae_t
-            self._v_mem[:, -1] = self.u.v
+            self.t[newest] = dae_t
+            self._v_mem[:, newest] = self.u.v
 
-        elif dae_t == self.t[-1]:
-            self._v_mem[:, -1] = self.u.v
+        elif dae_t == self.t[newest]:
+            self._v_mem[:, newest] = self.u.v
 
-        elif dae_t > self.t[-1]:
+        else:
             if self.mode == 'step':
-                self.t[:-1] = self.t[1:]
-                self.t[-1] = dae_t
-
-                self._v_mem[:, :-1] = self._v_mem[:, 1:]
-                self._v_mem[:, -1] = self.u.v
+                self._widx = (self._widx + 1) % (self.delay + 1)
+                self.t[self._widx] = dae_t
+                self._v_mem[:, self._widx] = self.u.v
             else:
-                self.t = np.append(self.t, dae_t)
-                self._v_mem = np.hstack((self._v_mem, self.u.v[:, None]))
+                self._push_time(dae_t)
 
                 if dae_t - self.t[0] > self.delay:
                     t_interp = dae_t - self.delay
                     idx = np.argmax(self.t >= t_interp) - 1
-                    v_interp = interp_n2(t_interp,
-                                         self.t[idx:idx+2],
-                                         self._v_mem[:, idx:idx + 2])
+
+                    if _interp2 is not None:
+                        # fused kernel writes the column in place without
+                        # the slice copies `interp_n2` sees
+                        _interp2(t_interp, self.t[idx], self.t[idx + 1],
+                                 self._v_mem[:, idx], self._v_mem[:, idx + 1],
+                                 self._v_mem[:, idx])
+                    else:
+                        self._v_mem[:, idx] = interp_n2(t_interp,
+                                                        self.t[idx:idx+2],
+                                                        self._v_mem[:, idx:idx + 2])
 
                     self.t[idx] = t_interp
-                    self._v_mem[:, idx] = v_interp
 
-                    self.t = np.delete(self.t, np.arange(0, idx))
-                    self._v_mem = np.delete(self._v_mem, np.arange(0, idx), axis=1)
+                    if idx > 0:
+                        self._start += idx
+                        self._bind_window()
 
-        self.v[:] = self._v_mem[:, 0]
+        if self.mode == 'step':
+            self.v[:] = self._v_mem[:, (self._widx + 1) % (self.delay + 1)]
+        else:
+            self.v[:] = self._v_mem[:, 0]
 
     def __repr__(self):
         out = ''
@@ -1402,13 +1806,29 @@ class Average(Delay):
         Delay.check_var(self, dae_t, *args, **kwargs)
 
         if dae_t == 0:
-            self.v[:] = self._v_mem[:, -1]
-            self._v_mem[:, :-1] = 0
+            newest = self._widx if self.mode == 'step' else -1
+            self.v[:] = self._v_mem[:, newest]
+            keep = self._v_mem[:, newest].copy()
+            self._v_mem[:] = 0
+            self._v_mem[:, newest] = keep
             return
         else:
-            nt = len(self.t)
-            self.v[:] = 0.5 * np.sum((self._v_mem[:, 1-nt:] + self._v_mem[:, -nt:-1]) *
-                                     (self.t[1:] - self.t[:-1]), axis=1) / (self.t[-1] - self.t[0])
+            if self.mode == 'step':
+                # gather the circular buffer in chronological order
+                size = self.delay + 1
+                order = (self._widx + 1 + np.arange(size)) % size
+                t = self.t[order]
+                v_mem = self._v_mem[:, order]
+            else:
+                t = self.t
+                v_mem = self._v_mem
+
+            if (_avg_kernel is not None) and (v_mem.shape[0] >= NUMBA_MIN_SIZE):
+                _avg_kernel(v_mem, t, self.v)
+            else:
+                nt = len(t)
+                self.v[:] = 0.5 * np.sum((v_mem[:, 1-nt:] + v_mem[:, -nt:-1]) *
+                                         (t[1:] - t[:-1]), axis=1) / (t[-1] - t[0])
 
 
 class Derivative(Delay):
@@ -1455,8 +1875,10 @@ class Derivative(Delay):
             self.v[:] = 0
 
         else:
-            self.v[:] = (self._v_mem[:, 1] - self._v_mem[:, 0]) / (self.t[1] - self.t[0])
-            self.v[np.where(np.abs(self.v) < 1e-8)] = 0
+            prev = 1 - self._widx
+            np.subtract(self._v_mem[:, self._widx], self._v_mem[:, prev], out=self.v)
+            self.v *= 1.0 / (self.t[self._widx] - self.t[prev])
+            np.putmask(self.v, np.abs(self.v) < 1e-8, 0.0)
 
 
 class Sampling(Discrete):
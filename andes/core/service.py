@@ -51,6 +51,9 @@ class BaseService:
         self.vtype = vtype if vtype is not None else float  # type for `v`
         self.owner = None
 
+        self._n = None      # cached count of elements in `v`
+        self._n_ref = None  # the `v` object for which `_n` was computed
+
     def get_names(self):
         """
         Return `name` in a list
@@ -94,10 +97,19 @@ class BaseService:
         int
             The count of elements in this variable
         """
-        if isinstance(self.v, (list, np.ndarray)):
-            return len(self.v)
+        v = self.v
+
+        # memoized per `v` object; rebinding `v` invalidates automatically
+        if v is self._n_ref:
+            return self._n
+
+        self._n_ref = v
+        if isinstance(v, (list, np.ndarray)):
+            self._n = len(v)
         else:
-            return 1
+            self._n = 1
+
+        return self._n
 
     def __repr__(self):
         val_str = ''
@@ -589,7 +601,10 @@ class ExtService(BaseService):
         self.default = default
         self.v = np.array([0.])
 
-    def link_external(self, ext_model):
+        self.uid = None        # resolved 0-based indices into the parent model
+        self._uid_key = None   # key for which `uid` was resolved
+
+    def link_external(self, ext_model, uid_memo=None):
         """
         Method to be called by ``System`` for getting values from the external
         model or group.
@@ -598,10 +613,46 @@ class ExtService(BaseService):
         ----------
         ext_model
             An instance of a model or group provided by System
+        uid_memo : dict, optional
+            A scratch dict shared across services being linked in one pass.
+            Services targeting the same parent through the same indexer reuse
+            the resolved indices instead of repeating ``idx2uid``.
         """
-        # set initial v values to zero
-        self.v = np.zeros(self.n)
-        if self.n == 0:
+        # size `v` after the indexer; the placeholder from `__init__` has
+        # length 1 regardless of how many devices are linked
+        if self.indexer is None:
+            n_ext = 0
+        elif isinstance(self.indexer.v, (list, tuple, np.ndarray)):
+            n_ext = len(self.indexer.v)
+        else:
+            n_ext = 1
+
+        if n_ext == 0:
+            self.v = np.zeros(0, dtype=self.vtype)
+            self._n, self._n_ref = 0, self.v
+            return
+
+        # fast path for Model parents with array storage: resolve the uids
+        # once and gather directly, skipping the per-element checks in `get`
+        instance = ext_model.__dict__.get(self.src)
+        attr_v = getattr(instance, self.attr, None) if instance is not None else None
+
+        if (not self.allow_none) and isinstance(attr_v, np.ndarray) and \
+                isinstance(self.indexer.v, (list, tuple, np.ndarray)):
+            key = (id(ext_model), ext_model.n,
+                   id(self.indexer.v), len(self.indexer.v))
+            if key != self._uid_key:
+                if uid_memo is not None and key in uid_memo:
+                    self.uid = uid_memo[key]
+                else:
+                    self.uid = np.array(ext_model.idx2uid(self.indexer.v),
+                                        dtype=int)
+                    if uid_memo is not None:
+                        uid_memo[key] = self.uid
+                self._uid_key = key
+
+            self.v = attr_v[self.uid]
+            self._n, self._n_ref = n_ext, self.v
             return
 
         # the same `get` api for Group and Model
@@ -609,6 +660,7 @@ class ExtService(BaseService):
                                allow_none=self.allow_none,
                                default=self.default,
                                )
+        self._n, self._n_ref = n_ext, self.v
 
 
 class DataSelect(BaseService):
@@ -902,6 +954,11 @@ class NumReduce(OperationService):
 
     """
 
+    # ufuncs usable with `reduceat` for the common reduction callables
+    _REDUCE_UFUNC = {np.sum: np.add, np.mean: np.add,
+                     np.max: np.maximum, np.min: np.minimum,
+                     np.prod: np.multiply}
+
     def __init__(self,
                  u,
                  ref: BackRef,
@@ -917,6 +974,9 @@ class NumReduce(OperationService):
         self.fun = fun
         self.cache = cache
 
+        self._offsets = None  # segment start offsets into `u.v`
+        self._lens = None     # segment lengths from `ref.v`
+
     @property
     def v(self):
         """
@@ -932,10 +992,28 @@ class NumReduce(OperationService):
         if self._v is None:
             self._v = np.zeros(len(self.ref.v))
 
-        idx = 0
-        for i, v in enumerate(self.ref.v):
-            self._v[i] = self.fun(self.u.v[idx:idx + len(v)])
-            idx += len(v)
+        if self._offsets is None:
+            self._lens = np.fromiter((len(v) for v in self.ref.v),
+                                     dtype=np.intp, count=len(self.ref.v))
+            self._offsets = np.concatenate(([0], np.cumsum(self._lens[:-1])))
+
+        u_v = np.asarray(self.u.v)
+        ufunc = self._REDUCE_UFUNC.get(self.fun)
+
+        # `reduceat` computes all segment reductions in one C-level pass;
+        # empty segments would repeat elements, and an input shorter than the
+        # segment layout (a ConstService read before `s_update`) would raise,
+        # so both take the clamping slice fallback
+        if ufunc is not None and len(self._lens) > 0 and self._lens.min() > 0 \
+                and len(u_v) >= self._offsets[-1] + self._lens[-1]:
+            self._v[:] = ufunc.reduceat(u_v, self._offsets)
+            if self.fun is np.mean:
+                self._v /= self._lens
+        else:
+            for i in range(len(self._lens)):
+                start = self._offsets[i]
+                self._v[i] = self.fun(u_v[start:start + self._lens[i]])
+
         return self._v
 
 
@@ -1010,6 +1088,7 @@ class NumRepeat(OperationService):
         super().__init__(**kwargs)
         self.u = u
         self.ref = ref
+        self._counts = None   # repeat counts from `ref.v`
 
     @property
     def v(self):
@@ -1021,15 +1100,12 @@ class NumRepeat(OperationService):
         The array, ``self._v`` storing the repeated values
         """
         if self._v is None:
-            self._v = np.zeros(len(list_flatten(self.ref.v)))
+            if self._counts is None:
+                self._counts = np.fromiter((len(v) for v in self.ref.v),
+                                           dtype=np.intp, count=len(self.ref.v))
+            self._v = np.repeat(np.asarray(self.u.v), self._counts)
 
-            idx = 0
-            for i, v in enumerate(self.ref.v):
-                self._v[idx:idx + len(v)] = self.u.v[i]
-                idx += len(v)
-            return self._v
-        else:
-            return self._v
+        return self._v
 
 
 class IdxRepeat(OperationService):
@@ -1052,7 +1128,7 @@ class IdxRepeat(OperationService):
     @property
     def v(self):
         if self._v is None:
-            self._v = [''] * len(list_flatten(self.ref.v))
+            self._v = [''] * sum(len(v) for v in self.ref.v)
             idx = 0
             for i, v in enumerate(self.ref.v):
                 for jj in range(idx, idx + len(v)):
@@ -1564,16 +1640,24 @@ class RandomService(BaseService):
         Name
     func : Callable
         A callable for generating the random variable.
+    cache : bool
+        True to generate once and reuse the values on later accesses.
 
     Warnings
     --------
-    The value will be randomized every time it is accessed. Do not use it if the
-    value needs to be stable for each simulation step.
+    Unless ``cache`` is True, the value will be randomized every time it is
+    accessed. Do not use it if the value needs to be stable for each
+    simulation step.
     """
 
-    def __init__(self, func=np.random.rand, **kwargs):
+    def __init__(self, func=np.random.rand, cache=False, **kwargs):
         super(RandomService, self).__init__(**kwargs)
         self.func = func
+        self.cache = cache
+        self._v = None
+
+        self._rng = np.random.default_rng()
+        self._buf = None    # reused output buffer for the default generator
 
     @property
     def v(self):
@@ -1585,7 +1669,20 @@ class RandomService(BaseService):
         array-like
             Randomly generated service variables
         """
-        return np.random.rand(self.n)
+        if self.cache and self._v is not None:
+            return self._v
+
+        if self.func is np.random.rand:
+            # fill a reused buffer with the faster `Generator` api instead of
+            # allocating through the legacy global RandomState
+            if self._buf is None or self._buf.shape[0] != self.n:
+                self._buf = np.empty(self.n)
+            self._rng.random(out=self._buf)
+            self._v = self._buf
+        else:
+            self._v = self.func(self.n)
+
+        return self._v
 
 
 class SwBlock(OperationService):
@@ -232,8 +232,17 @@ class SymProcessor:
             if len(elist) == 0 or not any(elist):  # `any`, not `all`
                 self.calls.__dict__[ename] = None
             else:
-                self.calls.__dict__[ename] = sp.lambdify(sym_args, tuple(elist),
-                                                         modules=self.lambdify_func)
+                try:
+                    # `cse` fuses subexpressions shared across the equations
+                    # of a model (e.g., `v**2` in both Shunt injections) so
+                    # the generated code computes them once
+                    self.calls.__dict__[ename] = sp.lambdify(sym_args, tuple(elist),
+                                                             modules=self.lambdify_func,
+                                                             cse=True)
+                except TypeError:
+                    # sympy < 1.9 does not support the `cse` argument
+                    self.calls.__dict__[ename] = sp.lambdify(sym_args, tuple(elist),
+                                                             modules=self.lambdify_func)
 
                 # manually append additional arguments for select.
                 if 'select' in inspect.getsource(self.calls.__dict__[ename]):
@@ -124,6 +124,7 @@ class BaseVar:
 
         self.e_inplace = False    # True if `self.e` is in-place access to `System.dae.__dict__[self.e_code]`
         self.v_inplace = False    # True if `self.v` is in-place access to `System.dae.__dict__[self.v_code]`
+        self.a_unique = False     # True if `self.a` holds no duplicate address (set in `store_adder_setter`)
         self.allow_none = False   # True to allow None in address (NOT IN USE)
 
     def reset(self):
@@ -447,6 +448,9 @@ class ExtVar(BaseVar):
         self._n = []
         self._n_count = 0
 
+        self.uid = None        # resolved 0-based indices into the parent model
+        self._uid_key = None   # key for which `uid` was resolved
+
     @property
     def _v(self):
         out = []
@@ -559,20 +563,39 @@ class ExtVar(BaseVar):
                                  original_var.name, original_var.class_name))
 
             if self.indexer is not None:
-                uid = ext_model.idx2uid(self.indexer.v)
+                # `idx2uid` is a per-element dict lookup; reuse the resolved
+                # indices when re-linking against an unchanged parent
+                key = (id(ext_model), ext_model.n,
+                       id(self.indexer.v), len(self.indexer.v))
+                if key != self._uid_key:
+                    self.uid = np.array(ext_model.idx2uid(self.indexer.v),
+                                        dtype=int)
+                    self._uid_key = key
             else:
-                uid = np.arange(ext_model.n, dtype=int)
-
-            self._n = [len(uid)]
-            if len(uid) > 0:
-                self.a = original_var.a[uid]
+                self.uid = np.arange(ext_model.n, dtype=int)
+                self._uid_key = None
+
+            self._n = [len(self.uid)]
+            if len(self.uid) > 0:
+                src_a = original_var.a
+                if isinstance(self.a, np.ndarray) and \
+                        self.a.shape == self.uid.shape and self.a.dtype == src_a.dtype:
+                    # refill the existing buffer when setup is re-run;
+                    # `take` with `out` also skips fancy-indexing setup
+                    np.take(src_a, self.uid, out=self.a)
+                else:
+                    self.a = src_a[self.uid]
             else:
                 self.a = np.array([], dtype=int)
 
             # set initial v and e values to zero
             self.n = len(self.a)
 
-        self.v = np.zeros(self.n)
+        # reuse the value buffer across repeated setups when the size matches
+        if isinstance(self.v, np.ndarray) and self.v.shape == (self.n,):
+            self.v.fill(0.0)
+        else:
+            self.v = np.zeros(self.n)
         # `self.e` is assigned in `set_arrays()`
 
 
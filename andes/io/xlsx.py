@@ -7,8 +7,11 @@ While I like the simplicity of the dome format,
 spreadsheets are easier to view and edit.
 """
 
+import json
 import logging
+import os
 
+from andes.core.param import NumParam
 from andes.utils.paths import confirm_overwrite
 from andes.shared import pd
 
@@ -44,7 +47,11 @@ def write(system, outfile, skip_empty=True, overwrite=None, add_book=None, **kwa
     if not confirm_overwrite(outfile, overwrite=overwrite):
         return False
 
-    writer = pd.ExcelWriter(outfile, engine='xlsxwriter')
+    # `constant_memory` streams rows to disk instead of keeping the whole
+    # workbook in memory; sheets are written in order, which both
+    # `_write_system` and `_add_book` already do
+    writer = pd.ExcelWriter(outfile, engine='xlsxwriter',
+                            engine_kwargs={'options': {'constant_memory': True}})
     writer = _write_system(system, writer, skip_empty)
     writer = _add_book(system, writer, add_book)
 
@@ -85,6 +92,70 @@ def _add_book(system, writer, add_book):
     return writer
 
 
+def _load_feather_cache(infile):
+    """
+    Load sheets from the feather sidecar cache written by a previous ``read``.
+
+    Returns ``None`` when the cache is missing, stale, or unreadable (e.g.,
+    pyarrow not installed).
+    """
+    cache_dir = infile + '.feather'
+    meta_path = os.path.join(cache_dir, 'sheets.json')
+
+    try:
+        # `sheets.json` is written last, so its mtime marks a complete cache
+        if os.path.getmtime(meta_path) <= os.path.getmtime(infile):
+            return None
+
+        with open(meta_path, 'r') as f:
+            sheets = json.load(f)
+
+        return {name: pd.read_feather(os.path.join(cache_dir, name + '.feather'))
+                for name in sheets}
+    except Exception as e:  # cache is best-effort; fall back to xlsx parsing
+        logger.debug('feather cache not used: %s', e)
+        return None
+
+
+def _write_feather_cache(infile, df_models):
+    """
+    Write parsed sheets to a feather sidecar cache for faster future loads.
+    """
+    cache_dir = infile + '.feather'
+
+    try:
+        import pyarrow  # NOQA; feather backend; do not create the cache dir without it
+    except ImportError:
+        logger.debug('feather cache not written: pyarrow not installed')
+        return
+
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for name, df in df_models.items():
+            df.reset_index(drop=True).to_feather(os.path.join(cache_dir, name + '.feather'))
+
+        with open(os.path.join(cache_dir, 'sheets.json'), 'w') as f:
+            json.dump(list(df_models.keys()), f)
+    except Exception as e:  # missing pyarrow, unwritable dir, exotic dtypes
+        logger.debug('feather cache not written: %s', e)
+
+
+def _numeric_dtypes(system, name):
+    """
+    Build a column dtype map for model ``name`` from its NumParam
+    declarations, or ``None`` for unknown sheets.
+
+    Typing numeric columns up front skips pandas' per-column inference and
+    keeps them float64 instead of object when cells are missing.
+    """
+    mdl = system.models.get(name)
+    if mdl is None:
+        return None
+
+    return {pname: float for pname, p in mdl.params.items()
+            if isinstance(p, NumParam)}
+
+
 def read(system, infile):
     """
     Read an xlsx file with ANDES model data into an empty system
@@ -101,17 +172,33 @@ def read(system, infile):
     System
         System instance after succeeded
     """
-    df_models = pd.read_excel(infile,
-                              sheet_name=None,
-                              index_col=None,
-                              engine='openpyxl',
-                              )
+    df_models = _load_feather_cache(infile) if isinstance(infile, str) else None
+
+    if df_models is None:
+        df_models = dict()
+        with pd.ExcelFile(infile, engine='openpyxl') as xl:
+            for sheet in xl.sheet_names:
+                dtype = _numeric_dtypes(system, sheet)
+                try:
+                    df_models[sheet] = xl.parse(sheet_name=sheet, index_col=None,
+                                                dtype=dtype)
+                except (TypeError, ValueError):
+                    # non-numeric data in a declared numeric column;
+                    # fall back to per-column inference
+                    df_models[sheet] = xl.parse(sheet_name=sheet, index_col=None)
+
+        for df in df_models.values():
+            # drop rows that all nan
+            df.dropna(axis=0, how='all', inplace=True)
+
+        if isinstance(infile, str):
+            _write_feather_cache(infile, df_models)
 
     for name, df in df_models.items():
-        # drop rows that all nan
-        df.dropna(axis=0, how='all', inplace=True)
-        for row in df.to_dict(orient='records'):
-            system.add(name, row)
+        # `itertuples` avoids materializing one dict per row up front
+        cols = df.columns.tolist()
+        for row in df.itertuples(index=False, name=None):
+            system.add(name, dict(zip(cols, row)))
 
     # --- for debugging ---
     system.df_in = df_models
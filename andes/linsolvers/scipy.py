@@ -53,10 +53,14 @@ class SpSolve(SciPySolver):
     scipy.sparse.linalg.spsolve Solver.
     """
 
+    def __init__(self):
+        super().__init__()
+        self._csc = None
+
     def solve(self, A, b):
 
         if self.factorize or self.new_A:
-            A_csc = spmatrix_to_csc(A)
+            A_csc = self._to_csc_cached(A)
             self.lu = splu(A_csc)
 
             self.factorize = False
@@ -65,6 +69,33 @@ class SpSolve(SciPySolver):
         x = self.lu.solve(np.ravel(b))
         return x
 
+    def _to_csc_cached(self, A):
+        """
+        Convert ``A`` to csc_matrix, recycling the cached matrix when the
+        sparsity pattern is unchanged.
+
+        The pattern is considered unchanged when the shape, nnz, column
+        pointers and row indices all match; only the value array is then
+        copied over.
+        """
+        csc = self._csc
+
+        if csc is not None and csc.shape == A.size:
+            ccs = A.CCS
+            if (csc.nnz == len(ccs[2])) and \
+                    np.array_equal(csc.indptr, np.array(ccs[0]).ravel()) and \
+                    np.array_equal(csc.indices, np.array(ccs[1]).ravel()):
+                csc.data[:] = np.array(ccs[2]).ravel()
+                return csc
+
+        self._csc = spmatrix_to_csc(A)
+        return self._csc
+
+    def clear(self):
+        self._csc = None
+        self.factorize = True
+        self.new_A = True
+
     def linsolve(self, A, b):
         """
         Solve using `spsolve`.
@@ -14,6 +14,7 @@ Main entry point for the ANDES CLI and scripting interfaces.
 #  File name: main.py
 #  Last modified: 8/16/20, 7:26 PM
 
+import atexit
 import cProfile
 import glob
 import io
@@ -22,10 +23,13 @@ import os
 import platform
 import pprint
 import pstats
+import queue
+import re
+import signal
 import sys
 from functools import partial
-from subprocess import call
-from time import sleep
+from logging.handlers import QueueHandler, QueueListener
+from subprocess import call, Popen
 from typing import Optional, Union
 
 from ._version import get_versions
@@ -39,6 +43,18 @@ from andes.utils.paths import get_config_path, get_log_dir, tests_root
 
 logger = logging.getLogger(__name__)
 
+# cached at import; `platform.system()` re-queries the OS on every call
+_PLATFORM = platform.system()
+
+# no ANDES formatter references thread or multiprocessing fields; skip their
+# per-record probes in `LogRecord.__init__`. `%(process)d` stays in the file
+# formatter to tell multiprocessing workers apart, so `logProcesses` is kept.
+logging.logThreads = False
+logging.logMultiprocessing = False
+
+# suffixes of output files produced by routines; see `remove_output`
+_OUTPUT_RE = re.compile(r'(_eig\.txt|_out\.(txt|lst|npy|npz)|_prof\.(prof|txt))$')
+
 
 def config_logger(stream_level=logging.INFO, *,
                   stream=True,
@@ -78,9 +94,6 @@ def config_logger(stream_level=logging.INFO, *,
     lg = logging.getLogger('andes')
     lg.setLevel(logging.DEBUG)
 
-    if log_path is None:
-        log_path = get_log_dir()
-
     sh_formatter_str = '%(message)s'
     if stream_level == 1:
         sh_formatter_str = '%(name)s:%(lineno)d - %(levelname)s - %(message)s'
@@ -98,19 +111,34 @@ def config_logger(stream_level=logging.INFO, *,
 
         # file handler for level DEBUG and up
         if file is True and (log_file is not None):
+            if log_path is None:
+                log_path = get_log_dir()
             log_full_path = os.path.join(log_path, log_file)
             fh_formatter = logging.Formatter('%(process)d: %(asctime)s - %(name)s - %(levelname)s - %(message)s')
             fh = logging.FileHandler(log_full_path)
-            fh.setLevel(file_level)
             fh.setFormatter(fh_formatter)
-            lg.addHandler(fh)
+
+            # hand records to a background thread so callers only pay an
+            # enqueue instead of a blocking format-and-write to disk
+            fh_queue = queue.Queue(-1)
+            qh = QueueHandler(fh_queue)
+            qh.setLevel(file_level)
+
+            listener = QueueListener(fh_queue, fh)
+            listener.start()
+            atexit.register(listener.stop)
+            qh.listener = listener
+            # forked workers check this to detect the missing listener thread
+            qh.os_pid = os.getpid()
+
+            lg.addHandler(qh)
 
         globals()['logger'] = lg
 
     else:
         # update the handlers
         set_logger_level(logger, logging.StreamHandler, stream_level)
-        set_logger_level(logger, logging.FileHandler, file_level)
+        set_logger_level(logger, QueueHandler, file_level)
 
     if not is_interactive():
         coloredlogs.install(logger=lg, level=stream_level, fmt=sh_formatter_str)
@@ -140,8 +168,9 @@ def edit_conf(edit_config: Optional[Union[str, bool]] = ''):
 
     if conf_path is None:
         logger.info('Config file does not exist. Automatically saving.')
-        system = System()
+        system = System(no_undill=True)
         conf_path = system.save_config()
+        get_config_path.cache_clear()
 
     logger.info('Editing config file "%s"', conf_path)
 
@@ -150,13 +179,11 @@ def edit_conf(edit_config: Optional[Union[str, bool]] = ''):
         # use `edit_config` as default editor
         editor = edit_config
     else:
-        # use the following default editors
-        if platform.system() == 'Linux':
-            editor = os.environ.get('EDITOR', 'vim')
-        elif platform.system() == 'Darwin':
-            editor = os.environ.get('EDITOR', 'vim')
-        elif platform.system() == 'Windows':
+        # use the platform default editor
+        if _PLATFORM == 'Windows':
             editor = 'notepad.exe'
+        else:
+            editor = os.environ.get('EDITOR', 'vim')
 
     editor_cmd = editor.split()
     editor_cmd.append(conf_path)
@@ -192,8 +219,10 @@ def save_conf(config_path=None, overwrite=None, **kwargs):
     if config_path is not None and os.path.isdir(config_path):
         config_path = os.path.join(config_path, 'andes.rc')
 
-    ps = System(**kwargs)
+    # writing defaults needs model configs only; skip loading generated code
+    ps = System(no_undill=True, **kwargs)
     ps.save_config(config_path, overwrite=overwrite)
+    get_config_path.cache_clear()
     ret = True
 
     return ret
@@ -216,7 +245,6 @@ def remove_output(recursive=False):
         ``True`` is the function body executes with success. ``False``
         otherwise.
     """
-    found = False
     cwd = os.getcwd()
 
     if recursive:
@@ -224,24 +252,31 @@ def remove_output(recursive=False):
     else:
         dirs = (cwd,)
 
+    # collect first so removal is one unlink per file; per-file messages
+    # are demoted to DEBUG and a single summary is logged instead
+    targets = []
     for d in dirs:
-        for file in os.listdir(d):
-            if file.endswith('_eig.txt') or \
-                    file.endswith('_out.txt') or \
-                    file.endswith('_out.lst') or \
-                    file.endswith('_out.npy') or \
-                    file.endswith('_out.npz') or \
-                    file.endswith('_prof.prof') or \
-                    file.endswith('_prof.txt'):
-                found = True
-                try:
-                    os.remove(os.path.join(d, file))
-                    logger.info('"%s" removed.', os.path.join(d, file))
-                except IOError:
-                    logger.error('Error removing file "%s".',
-                                 os.path.join(d, file))
-    if not found:
+        # `scandir` hands back names without a per-entry stat, and one
+        # compiled regex replaces the chain of `endswith` tests
+        with os.scandir(d) as it:
+            targets.extend(entry.path for entry in it
+                           if _OUTPUT_RE.search(entry.name))
+
+    debug_on = logger.isEnabledFor(logging.DEBUG)
+    n_removed = 0
+    for path in targets:
+        try:
+            os.remove(path)
+            n_removed += 1
+            if debug_on:
+                logger.debug('"%s" removed.', path)
+        except IOError:
+            logger.error('Error removing file "%s".', path)
+
+    if len(targets) == 0:
         logger.info('No output file found in the working directory.')
+    else:
+        logger.info('Removed %d output files.', n_removed)
 
     return True
 
@@ -325,7 +360,30 @@ def load(case, codegen=False, setup=True,
     return system
 
 
-def run_case(case, *, routine='pflow', profile=False,
+def _ensure_file_logging():
+    """
+    Restore direct file logging in forked worker processes.
+
+    ``config_logger`` drains the `FileHandler` through a `QueueListener`
+    thread, which a forked child does not inherit: records the child puts on
+    the inherited queue are never written. When running in a process other
+    than the one that configured logging, swap the inherited `QueueHandler`
+    for its underlying `FileHandler` so child records reach the log file.
+    """
+
+    lg = logging.getLogger('andes')
+    for h in list(lg.handlers):
+        listener = getattr(h, 'listener', None)
+        if isinstance(h, QueueHandler) and listener is not None \
+                and getattr(h, 'os_pid', None) != os.getpid():
+            lg.removeHandler(h)
+            for fh in listener.handlers:
+                fh.setLevel(h.level)
+                lg.addHandler(fh)
+
+
+def run_case(case, *, routine='pflow', profile=False, profile_text=False,
+             profile_mode='cprofile',
              convert='', convert_all='', add_book=None,
              codegen=False, autogen_stale=True,
              remove_pycapsule=False, **kwargs):
@@ -345,6 +403,15 @@ def run_case(case, *, routine='pflow', profile=False,
         Computation routine to run
     profile : bool, optional
         True to enable profiler
+    profile_text : bool, optional
+        True to also write the sorted text report next to the raw
+        profiler data. The raw data is always written when output
+        files are enabled.
+    profile_mode : str, ('cprofile', 'sample')
+        Profiler backend. ``cprofile`` instruments every call and can
+        slow tight loops severalfold; ``sample`` records a flame graph
+        with ``py-spy`` at roughly 1% overhead. Requires ``py-spy`` on
+        the search path.
     convert : str, optional
         Format name for case file conversion.
     convert_all : str, optional
@@ -363,9 +430,14 @@ def run_case(case, *, routine='pflow', profile=False,
 
     """
 
+    _ensure_file_logging()
+
     pr = cProfile.Profile()
-    # enable profiler if requested
-    if profile is True:
+    sampler = None
+    sampler_out = None
+    # enable the instrumenting profiler if requested; the sampling
+    # profiler is attached right before the routines run
+    if profile is True and profile_mode != 'sample':
         pr.enable()
 
     system = load(case,
@@ -393,6 +465,10 @@ def run_case(case, *, routine='pflow', profile=False,
                       add_book=add_book)
         return system
 
+    # attach the sampling profiler around the routine block
+    if profile is True and profile_mode == 'sample':
+        sampler, sampler_out = _start_sampler(system)
+
     # run the requested routine
     if routine is not None:
         if isinstance(routine, str):
@@ -409,7 +485,15 @@ def run_case(case, *, routine='pflow', profile=False,
             logger.error("System is not set up. Routines cannot continue.")
 
     # Disable profiler and output results
-    if profile:
+    if profile and sampler is not None:
+        sampler.send_signal(signal.SIGINT)
+        try:
+            sampler.wait(timeout=30)
+            logger.info('py-spy flame graph written to "%s".', sampler_out)
+        except Exception as e:
+            logger.error('Error stopping py-spy: %s', e)
+
+    elif profile and profile_mode != 'sample':
         pr.disable()
 
         if system.files.no_output:
@@ -420,12 +504,16 @@ def run_case(case, *, routine='pflow', profile=False,
             logger.info(s.getvalue())
             s.close()
         else:
-            nlines = 999
-            with open(system.files.prof, 'w') as s:
-                ps = pstats.Stats(pr, stream=s).sort_stats('cumtime')
-                ps.print_stats(nlines)
-                ps.dump_stats(system.files.prof_raw)
-            logger.info('cProfile text data written to "%s".', system.files.prof)
+            # the text render of the full call graph is expensive and
+            # rarely consulted; write it only on request
+            if profile_text is True:
+                nlines = 999
+                with open(system.files.prof, 'w') as s:
+                    ps = pstats.Stats(pr, stream=s).sort_stats('cumtime')
+                    ps.print_stats(nlines)
+                logger.info('cProfile text data written to "%s".', system.files.prof)
+
+            pr.dump_stats(system.files.prof_raw)
             logger.info('cProfile raw data written to "%s". View with tool `snakeviz`.', system.files.prof_raw)
 
     if remove_pycapsule is True:
@@ -434,6 +522,28 @@ def run_case(case, *, routine='pflow', profile=False,
     return system
 
 
+def _start_sampler(system):
+    """
+    Spawn ``py-spy record`` attached to the current process.
+
+    Returns
+    -------
+    tuple
+        The ``Popen`` handle and the output file path, or ``(None, None)``
+        if py-spy cannot be started.
+    """
+    out = system.files.prof_raw + '.svg'
+
+    try:
+        proc = Popen(['py-spy', 'record', '-o', out, '--pid', str(os.getpid())])
+    except OSError as e:
+        logger.error('Cannot start py-spy for sampling profiler: %s', e)
+        logger.error('Install py-spy or use `--profile-mode cprofile`.')
+        return None, None
+
+    return proc, out
+
+
 def _find_cases(filename, path):
     """
     Find valid cases using the provided names and path
@@ -456,24 +566,30 @@ def _find_cases(filename, path):
     if isinstance(filename, str):
         filename = [filename]
 
-    cases = []
+    # deduplicate and filter out folders in a single pass over the matches
+    valid_cases = set()
     for file in filename:
         full_paths = os.path.join(path, file)
-        found = glob.glob(full_paths)
-        if len(found) == 0:
-            logger.error('error: file "%s" does not exist.', full_paths)
+
+        if any(c in full_paths for c in '*?['):
+            matches = glob.iglob(full_paths)
         else:
-            cases += found
-
-    # remove folders and make cases unique
-    unique_cases = list(set(cases))
-    valid_cases = []
-    for case in unique_cases:
-        if os.path.isfile(case):
-            valid_cases.append(case)
+            # literal path: a single existence test replaces the
+            # directory scan that glob would perform
+            matches = (full_paths,) if os.path.exists(full_paths) else ()
+
+        found = False
+        for match in matches:
+            found = True
+            if os.path.isfile(match):
+                valid_cases.add(match)
+        if not found:
+            logger.error('error: file "%s" does not exist.', full_paths)
+
+    valid_cases = sorted(valid_cases)
     if len(valid_cases) > 0:
-        valid_cases = sorted(valid_cases)
-        logger.debug('Found files: %s', pprint.pformat(valid_cases))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug('Found files: %s', pprint.pformat(valid_cases))
 
     return valid_cases
 
@@ -496,6 +612,10 @@ def find_log_path(lg):
     for h in lg.handlers:
         if isinstance(h, logging.FileHandler):
             out.append(h.baseFilename)
+        elif isinstance(h, QueueHandler) and getattr(h, 'listener', None) is not None:
+            for hh in h.listener.handlers:
+                if isinstance(hh, logging.FileHandler):
+                    out.append(hh.baseFilename)
     return out
 
 
@@ -506,20 +626,35 @@ def _run_mp_proc(cases, ncpu=NCPUS_PHYSICAL, **kwargs):
     Return values from `run_case` are not preserved. Always return `True` when done.
     """
 
-    # start processes
-    jobs = []
-    for idx, file in enumerate(cases):
-        job = Process(name=f'Process {idx:d}', target=run_case, args=(file,), kwargs=kwargs)
-        jobs.append(job)
-        job.start()
-        start_msg = f'Process {idx:d} for "{file:s}" started.'
-        print(start_msg)
-        logger.debug(start_msg)
-        if (idx % ncpu == ncpu - 1) or (idx == len(cases) - 1):
-            sleep(0.1)
-            for job in jobs:
+    from multiprocess.connection import wait as mp_wait
+
+    # dynamic dispatch: keep up to `ncpu` workers busy and hand the next
+    # case to whichever finishes first, instead of joining fixed batches
+    # where one slow case stalls the whole window
+    pending = list(enumerate(cases))
+    active = []
+
+    while pending or active:
+        while pending and len(active) < ncpu:
+            idx, file = pending.pop(0)
+            job = Process(name=f'Process {idx:d}', target=run_case, args=(file,), kwargs=kwargs)
+            job.start()
+            active.append(job)
+            start_msg = f'Process {idx:d} for "{file:s}" started.'
+            print(start_msg)
+            logger.debug(start_msg)
+
+        # block until at least one worker exits; no polling interval
+        if active:
+            mp_wait([job.sentinel for job in active])
+
+        still_active = []
+        for job in active:
+            if job.is_alive():
+                still_active.append(job)
+            else:
                 job.join()
-            jobs = []
+        active = still_active
 
     return True
 
@@ -558,7 +693,7 @@ def _run_mp_pool(cases, ncpu=NCPUS_PHYSICAL, verbose=logging.INFO, **kwargs):
     return ret
 
 
-def run(filename, input_path='', verbose=20, mp_verbose=30, ncpu=NCPUS_PHYSICAL, pool=False,
+def run(filename, input_path='', verbose=20, mp_verbose=30, ncpu=None, pool=False,
         cli=False, codegen=False, shell=False, **kwargs):
     """
     Entry point to run ANDES routines.
@@ -575,7 +710,8 @@ def run(filename, input_path='', verbose=20, mp_verbose=30, ncpu=NCPUS_PHYSICAL,
     mp_verbose : int
         Verbosity level for multiprocessing tasks
     ncpu : int, optional
-        Number of cpu cores to use in parallel
+        Number of cpu cores to use in parallel.
+        Use all physical CPUs if ``None``.
     pool: bool, optional
         Use Pool for multiprocessing to return a list of created Systems.
     kwargs
@@ -598,6 +734,9 @@ def run(filename, input_path='', verbose=20, mp_verbose=30, ncpu=NCPUS_PHYSICAL,
     if is_interactive() and len(logger.handlers) == 0:
         config_logger(verbose, file=False)
 
+    if ncpu is None:
+        ncpu = NCPUS_PHYSICAL
+
     # put some args back to `kwargs`
     kwargs['input_path'] = input_path
     kwargs['verbose'] = verbose
@@ -617,10 +756,14 @@ def run(filename, input_path='', verbose=20, mp_verbose=30, ncpu=NCPUS_PHYSICAL,
         # import `pycode` to local namespace to avoid a picking issue
         import_pycode()
 
+        # longest-job-first: start the largest inputs early so they overlap
+        # with the tail of smaller cases instead of running alone at the end
+        cases.sort(key=os.path.getsize, reverse=True)
+
         # suppress logging output during multiprocessing
         logger.info('-> Processing %s jobs on %s CPUs.', len(cases), ncpu)
         set_logger_level(logger, logging.StreamHandler, mp_verbose)
-        set_logger_level(logger, logging.FileHandler, logging.DEBUG)
+        set_logger_level(logger, QueueHandler, logging.DEBUG)
 
         if pool is True:
             system = _run_mp_pool(cases,
@@ -761,7 +904,9 @@ def prepare(quick=False, incremental=False, models=None,
 
     cli = kwargs.get("cli", False)
     full = kwargs.get("full", False)
-    ncpu = kwargs.get("ncpu", NCPUS_PHYSICAL)
+    ncpu = kwargs.get("ncpu", None)
+    if ncpu is None:
+        ncpu = NCPUS_PHYSICAL
 
     if cli is True:
         if not full:
@@ -25,6 +25,8 @@ class PFlow(BaseRoutine):
                                      ('method', 'NR'),
                                      ('check_conn', 1),
                                      ('n_factorize', 4),
+                                     ('line_search', 0),
+                                     ('aitken', 0),
                                      ('report', 1),
                                      ('degree', 0),
                                      ('init_tds', 0),
@@ -35,6 +37,8 @@ class PFlow(BaseRoutine):
                               method="calculation method",
                               check_conn='check connectivity before power flow',
                               n_factorize="first N iterations to factorize Jacobian in dishonest method",
+                              line_search="use backtracking line search on the Newton step",
+                              aitken="use Aitken extrapolation on converging NR iterations",
                               report="write output report",
                               degree='use degree in report',
                               init_tds="initialize TDS after PFlow",
@@ -45,6 +49,8 @@ class PFlow(BaseRoutine):
                               check_conn=(0, 1),
                               max_iter=">=10",
                               n_factorize=">0",
+                              line_search=(0, 1),
+                              aitken=(0, 1),
                               report=(0, 1),
                               degree=(0, 1),
                               init_tds=(0, 1),
@@ -121,20 +127,25 @@ class PFlow(BaseRoutine):
             system.j_update(self.models)
             self.solver.worker.new_A = True
 
+            # rebuild A only when the Jacobian values changed;
+            # otherwise, the A from the previous iteration is still valid
+            self.A = sparse([[system.dae.fx, system.dae.gx],
+                             [system.dae.fy, system.dae.gy]])
+
         # ---------- prepare and solve linear equations ----------
         self.res[:system.dae.n] = -system.dae.f[:]
         self.res[system.dae.n:] = -system.dae.g[:]
 
-        self.A = sparse([[system.dae.fx, system.dae.gx],
-                         [system.dae.fy, system.dae.gy]])
-
         if not self.config.linsolve:
             self.inc = self.solver.solve(self.A, self.res)
         else:
             self.inc = self.solver.linsolve(self.A, self.res)
 
-        system.dae.x += np.ravel(self.inc[:system.dae.n])
-        system.dae.y += np.ravel(self.inc[system.dae.n:])
+        if self.config.line_search:
+            self._line_search(np.ravel(self.inc))
+        else:
+            system.dae.x += np.ravel(self.inc[:system.dae.n])
+            system.dae.y += np.ravel(self.inc[system.dae.n:])
 
         # find out variables associated with maximum mismatches
         fmax = 0
@@ -152,11 +163,61 @@ class PFlow(BaseRoutine):
 
         return mis
 
+    def _line_search(self, inc, alphas=(1.0, 0.5, 0.25)):
+        """
+        Apply the Newton increment with Armijo-style backtracking.
+
+        Starting from the full step, the step size is halved until the largest
+        mismatch decreases sufficiently. If no trial step qualifies, the full
+        step is applied as in the plain Newton method.
+
+        Parameters
+        ----------
+        inc : numpy.ndarray
+            Newton increment for ``[x, y]`` as a 1-D array.
+        alphas : tuple
+            Step sizes to try, in descending order.
+        """
+
+        system = self.system
+        n = system.dae.n
+
+        mis0 = max(np.max(np.abs(system.dae.f), initial=0),
+                   np.max(np.abs(system.dae.g), initial=0))
+
+        x0 = system.dae.x.copy()
+        y0 = system.dae.y.copy()
+
+        for alpha in alphas:
+            system.dae.x[:] = x0 + alpha * inc[:n]
+            system.dae.y[:] = y0 + alpha * inc[n:]
+            system.vars_to_models()
+            self.fg_update()
+
+            mis = max(np.max(np.abs(system.dae.f), initial=0),
+                      np.max(np.abs(system.dae.g), initial=0))
+
+            if mis < (1 - 1e-4 * alpha) * mis0:
+                if alpha != 1.0:
+                    logger.debug('Line search accepted step size %g', alpha)
+                return
+
+        # no trial step decreased the mismatch; fall back to the full step
+        logger.debug('Line search failed to reduce mismatch; taking the full step')
+        system.dae.x[:] = x0 + inc[:n]
+        system.dae.y[:] = y0 + inc[n:]
+        system.vars_to_models()
+        self.fg_update()
+
     def nr_solve(self):
         """
         Solve the power flow problem using itertive Newton's method.
         """
 
+        tol = self.config.tol
+        max_iter = self.config.max_iter
+        use_aitken = self.config.aitken
+
         self.niter = 0
         while True:
             mis = self.nr_step()
@@ -169,11 +230,11 @@ class PFlow(BaseRoutine):
                 self.mis.append(mis)
 
             # check for convergence
-            if mis < self.config.tol:
+            if mis < tol:
                 self.converged = True
                 break
 
-            if self.niter > self.config.max_iter:
+            if self.niter > max_iter:
                 break
 
             if np.isnan(mis).any():
@@ -184,10 +245,53 @@ class PFlow(BaseRoutine):
                 logger.error('Mismatch increased too fast. Convergence is not likely.')
                 break
 
+            if use_aitken and self.niter >= 2:
+                self._aitken_step()
+
             self.niter += 1
 
         return self.converged
 
+    def _aitken_step(self):
+        """
+        Apply Aitken extrapolation along the last Newton increment.
+
+        When the mismatch history shrinks geometrically with ratio ``r``, the
+        remaining error is approximately ``r / (1 - r)`` times the last step.
+        The extrapolated point is kept only if it reduces the mismatch.
+        """
+
+        system = self.system
+        n = system.dae.n
+
+        d1 = self.mis[-1] - self.mis[-2]
+        d2 = self.mis[-2] - self.mis[-3]
+        if d2 == 0:
+            return
+
+        r = d1 / d2
+        if not 0 < r < 1:
+            return
+
+        inc = np.ravel(self.inc)
+        x0 = system.dae.x.copy()
+        y0 = system.dae.y.copy()
+
+        system.dae.x += (r / (1 - r)) * inc[:n]
+        system.dae.y += (r / (1 - r)) * inc[n:]
+        system.vars_to_models()
+        self.fg_update()
+
+        mis = max(np.max(np.abs(system.dae.f), initial=0),
+                  np.max(np.abs(system.dae.g), initial=0))
+
+        if mis < self.mis[-1]:
+            logger.debug('Aitken extrapolation reduced mismatch to %.10g', mis)
+        else:
+            system.dae.x[:] = x0
+            system.dae.y[:] = y0
+            system.vars_to_models()
+
     def summary(self):
         """
         Output a summary for the PFlow routine.
@@ -326,10 +430,40 @@ class PFlow(BaseRoutine):
         system.l_update_eq(self.models, niter=0)
         system.fg_to_dae()
 
+    def _nk_preconditioner(self):
+        """
+        Build an ILU-based preconditioner for the Newton-Krylov method from
+        the Jacobian at the initial point.
+
+        Returns ``None`` if the incomplete factorization fails, in which case
+        ``newton_krylov`` runs unpreconditioned.
+        """
+
+        system = self.system
+
+        try:
+            from scipy.sparse.linalg import LinearOperator, spilu
+
+            from andes.linsolvers.scipy import spmatrix_to_csc
+
+            self.fg_update()
+            system.j_update(self.models)
+            A_csc = spmatrix_to_csc(sparse([[system.dae.fx, system.dae.gx],
+                                            [system.dae.fy, system.dae.gy]]))
+            ilu = spilu(A_csc, drop_tol=1e-4)
+
+            return LinearOperator(A_csc.shape, matvec=ilu.solve)
+        except Exception as e:
+            logger.debug('ILU preconditioner not used: %s', e)
+            return None
+
     def newton_krylov(self, verbose=True):
         """
         Full Newton-Krylov method from SciPy.
 
+        An incomplete-LU preconditioner built from the initial Jacobian is
+        used for the inner Krylov iterations when available.
+
         Warnings
         --------
         The result might be wrong if discrete are in use!
@@ -349,7 +483,8 @@ class PFlow(BaseRoutine):
         v0 = system.dae.xy
 
         try:
-            ret = newton_krylov(self._fg_wrapper, v0, verbose=verbose)
+            ret = newton_krylov(self._fg_wrapper, v0, verbose=verbose,
+                                inner_M=self._nk_preconditioner())
             self._set_xy(ret)
             self.converged = True
 
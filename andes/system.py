@@ -360,6 +360,10 @@ class System:
             self._finalize_pycode(pycode_path)
             self._store_calls(models)
 
+            # generated files changed; force a reimport on the next load
+            global _pycode_cache
+            _pycode_cache = None
+
         _, s = elapsed(t0)
         logger.info('Generated numerical code for %d models in %s.', len(models), s)
 
@@ -698,11 +702,40 @@ class System:
                 continue
 
             for var in mdl.cache.vars_int.values():
-                var.set_arrays(self.dae, inplace=inplace, alloc=alloc)
+                var.set_arrays(self.dae, inplace=inplace, alloc=False)
+
+            if alloc:
+                self._alloc_var_arrays(mdl)
 
             for var in mdl.cache.vars_ext.values():
                 var.set_arrays(self.dae, inplace=inplace, alloc=alloc)
 
+    def _alloc_var_arrays(self, mdl):
+        """
+        Allocate `v` and `e` for internal variables that cannot share memory
+        with the dae arrays.
+
+        All such arrays of one model are slice views into two contiguous
+        per-model buffers, so equation and value passes walk packed memory
+        instead of many isolated small arrays.
+        """
+
+        v_vars = [var for var in mdl.cache.vars_int.values() if not var.v_inplace]
+        e_vars = [var for var in mdl.cache.vars_int.values() if not var.e_inplace]
+
+        mdl._v_buf = np.zeros(sum(var.n for var in v_vars))
+        mdl._e_buf = np.zeros(sum(var.n for var in e_vars))
+
+        pos = 0
+        for var in v_vars:
+            var.v = mdl._v_buf[pos:pos + var.n]
+            pos += var.n
+
+        pos = 0
+        for var in e_vars:
+            var.e = mdl._e_buf[pos:pos + var.n]
+            pos += var.n
+
     def _init_numba(self, models: OrderedDict):
         """
         Helper function to compile all functions with Numba before init.
@@ -804,6 +837,10 @@ class System:
 
         self._init_numba(models)
 
+        # shared across services so idx translation for a common
+        # (parent, indexer) pair is done once per pass
+        uid_memo = dict()
+
         for mdl in models.values():
             # link externals services first
             for instance in mdl.services_ext.values():
@@ -814,7 +851,7 @@ class System:
                     raise KeyError('<%s> is not a model or group name.' % ext_name)
 
                 try:
-                    instance.link_external(ext_model)
+                    instance.link_external(ext_model, uid_memo=uid_memo)
                 except (IndexError, KeyError) as e:
                     logger.error('Error: <%s> cannot retrieve <%s> from <%s> using <%s>:\n  %s',
                                  mdl.class_name, instance.name, instance.model,
@@ -859,6 +896,8 @@ class System:
             for var in mdl.cache.v_adders.values():
                 self._adders[var.v_code].append(var)
             for var in mdl.cache.e_adders.values():
+                # duplicate-free addresses allow the fast `+=` scatter in `_e_to_dae`
+                var.a_unique = (len(np.unique(var.a)) == len(var.a))
                 self._adders[var.e_code].append(var)
 
             # ``setters`` that force set variable values in the DAE array
@@ -1449,10 +1488,17 @@ class System:
             eq_name = [eq_name]
 
         for name in eq_name:
+            dest = self.dae.__dict__[name]
             for var in self._adders[name]:
-                np.add.at(self.dae.__dict__[name], var.a, var.e)
+                # fancy-indexed `+=` is buffered and much faster than the
+                # unbuffered `np.add.at`, but is only correct when `var.a`
+                # contains no duplicate address
+                if var.a_unique:
+                    dest[var.a] += var.e
+                else:
+                    np.add.at(dest, var.a, var.e)
             for var in self._setters[name]:
-                np.put(self.dae.__dict__[name], var.a, var.e)
+                np.put(dest, var.a, var.e)
 
     def get_z(self, models: OrderedDict):
         """
@@ -1566,7 +1612,10 @@ class System:
 
         loaded = False
         user_pycode_path = self.options.get("pycode_path")
-        pycode = import_pycode(user_pycode_path=user_pycode_path)
+
+        # reuse the module imported by an earlier System in this process;
+        # re-running the generated code is only needed after regeneration
+        pycode = import_pycode(user_pycode_path=user_pycode_path, reload=False)
 
         if pycode:
             try:
@@ -2212,7 +2261,12 @@ def fix_view_arrays(system):
     return True
 
 
-def import_pycode(user_pycode_path=None):
+# imported ``pycode`` module shared by System instances in this process;
+# invalidated by ``prepare()`` after regenerating code
+_pycode_cache = None
+
+
+def import_pycode(user_pycode_path=None, reload=True):
     """
     Helper function to import generated pycode in the following priority:
 
@@ -2221,8 +2275,19 @@ def import_pycode(user_pycode_path=None):
     2. ``~/.andes/pycode``. This is where pycode is stored by default.
     3. ``<andes_package_root>/pycode``. One can store pycode in the ANDES
        package folder and ship a full package, which does not require code generation.
+
+    Parameters
+    ----------
+    reload : bool, optional
+        False to reuse the module imported earlier in this process, if any.
+        Reloading is only needed after code has been regenerated.
     """
 
+    global _pycode_cache
+
+    if reload is False and _pycode_cache is not None:
+        return _pycode_cache
+
     # below are executed serially because of priority
     pycode = reload_submodules('pycode')
     if not pycode:
@@ -2233,6 +2298,7 @@ def import_pycode(user_pycode_path=None):
     if not pycode:
         pycode = _import_pycode_from(os.path.join(andes_root(), 'pycode'))
 
+    _pycode_cache = pycode if pycode else None
     return pycode
 
 
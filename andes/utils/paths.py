@@ -1,6 +1,7 @@
 """
 Utility functions for loading andes stock test cases
 """
+import functools
 import logging
 import os
 import pathlib
@@ -151,12 +152,16 @@ def list_cases(rpath='.', no_print=False):
         return out
 
 
+@functools.lru_cache(maxsize=None)
 def get_config_path(file_name='andes.rc'):
     """
     Return the path of the config file to be loaded.
 
     Search Priority: 1. current directory; 2. home directory.
 
+    The result is cached for the lifetime of the process. Call
+    ``get_config_path.cache_clear()`` after writing a new config file.
+
     Parameters
     ----------
     file_name : str, optional
@@ -202,12 +207,15 @@ def get_dot_andes_path():
     return os.path.join(str(pathlib.Path.home()), '.andes')
 
 
+@functools.lru_cache(maxsize=None)
 def get_log_dir():
     """
     Get the directory for log file.
 
     The default is ``<tempdir>/andes``, where ``<tempdir>`` is provided by ``tempfile.gettempdir()``.
 
+    The directory is created once per process and reused afterwards.
+
     Returns
     -------
     str
@@ -1,3 +1,4 @@
+import functools
 import io
 import logging
 import os
@@ -127,19 +128,32 @@ class FileMan:
         if isinstance(fullname, io.IOBase):
             return ''
 
-        isabs = os.path.isabs(fullname)
+        return _resolve_fullpath(self.input_path, fullname)
 
-        path, name = os.path.split(fullname)
 
-        if not name:  # path to a folder
-            return ''
-        else:  # path to a file
-            if isabs:
-                return fullname
-            else:
-                return os.path.join(self.input_path, path, name)
+@functools.lru_cache(maxsize=256)
+def _resolve_fullpath(input_path, fullname):
+    """
+    Resolve ``fullname`` against ``input_path``.
+
+    Cached because `FileMan.set` is called once per run with the same paths
+    in batch loops.
+    """
+
+    isabs = os.path.isabs(fullname)
+
+    path, name = os.path.split(fullname)
+
+    if not name:  # path to a folder
+        return ''
+    else:  # path to a file
+        if isabs:
+            return fullname
+        else:
+            return os.path.join(input_path, path, name)
 
 
+@functools.lru_cache(maxsize=256)
 def add_suffix(fullname, suffix):
     """
     Add suffix to a full file name.
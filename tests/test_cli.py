@@ -11,3 +11,44 @@ class TestCLI(unittest.TestCase):
     def test_misc(self):
         andes.main.misc(show_license=True)
         andes.main.misc(save_config=None, overwrite=True)
+
+    def test_help_text(self):
+        """
+        The frozen top-level help must match what argparse would render.
+        """
+        import os
+
+        from andes.cli import create_parser, help_text
+
+        os.environ['COLUMNS'] = '80'
+        self.assertEqual(help_text, create_parser().format_help())
+
+    def test_fast_parse_run(self):
+        """
+        The fast `run` parser must agree with argparse where it applies
+        and fall back on anything it does not recognize.
+        """
+        from andes.cli import _fast_parse_run, create_parser
+
+        argvs = (['andes', 'run', 'case.xlsx'],
+                 ['andes', 'run', 'case.xlsx', '--ncpu', '2', '--profile'],
+                 ['andes', 'run', 'a.xlsx', 'b.xlsx', '-r', 'tds', '--tf', '5',
+                  '-n', '--no-pbar'],
+                 )
+        for argv in argvs:
+            fast = _fast_parse_run(argv)
+            full = create_parser('run').parse_args(argv[1:])
+            self.assertEqual(vars(fast), vars(full))
+
+        self.assertIsNone(_fast_parse_run(['andes', 'run', '--unknown']))
+        self.assertIsNone(_fast_parse_run(['andes', 'run', '-r', 'nosuch']))
+
+    def test_routine_names(self):
+        """
+        The hard-coded routine names in `andes.cli` must not drift from
+        the registered routines.
+        """
+        from andes.cli import routine_names
+        from andes.routines import routine_cli
+
+        self.assertEqual(set(routine_names), set(routine_cli.keys()))
@@ -2,7 +2,7 @@ import unittest
 
 from andes.core.common import DummyValue
 from andes.core.discrete import (Average, Delay, Derivative, Limiter,
-                                 SortedLimiter, Switcher,)
+                                 LimiterGroup, SortedLimiter, Switcher,)
 from andes.core.param import NumParam
 from andes.core.var import Algeb
 from andes.shared import np
@@ -85,6 +85,30 @@ class TestDiscrete(unittest.TestCase):
         self.assertSequenceEqual(rcmp_noselect.zu.tolist(),
                                  cmp.zu.tolist())
 
+    def test_limiter_group(self):
+        """
+        Batched limiters must produce the same flags as individual ones.
+        """
+        ref = Limiter(self.u, self.lower, self.upper)
+        ref.list2array(len(self.u.v))
+        ref.check_var()
+
+        lim1 = Limiter(self.u, self.lower, self.upper)
+        lim1.list2array(len(self.u.v))
+        lim2 = Limiter(self.u, self.lower, self.upper)
+        lim2.list2array(len(self.u.v))
+
+        group = LimiterGroup()
+        group.add(lim1)
+        group.add(lim2)
+        group.finalize()
+        group.check_var()
+
+        for lim in (lim1, lim2):
+            self.assertSequenceEqual(lim.zl.tolist(), ref.zl.tolist())
+            self.assertSequenceEqual(lim.zi.tolist(), ref.zi.tolist())
+            self.assertSequenceEqual(lim.zu.tolist(), ref.zu.tolist())
+
     def test_switcher(self):
         p = NumParam()
         p.v = np.array([0, 1, 2, 2, 1, 3, 1])